@@ -1,11 +1,13 @@
 # cli.py
 import argparse
 from event_study import (
-    loadDaily,
+    loadSeries,
     pickEvents,
     forwardReturns,
     summarize,
     makeEventTable,   # <-- new: build a table of event dates/details
+    loadBenchmark,
+    alignBenchmark,
 )
 
 def main():
@@ -19,6 +21,7 @@ def main():
     # new quality-of-life flags:
     ap.add_argument("--showDates", type=int, default=0, help="Print first/last K event dates")
     ap.add_argument("--eventsOut", default=None, help="CSV path to save all event dates")
+    ap.add_argument("--benchmark", default=None, help="Report excess returns vs this ticker, e.g. SPY")
 
     args = ap.parse_args()
 
@@ -31,14 +34,17 @@ def main():
         horizons.append(int(x))
 
     # load data and run study
-    df = loadDaily(args.symbol, start=args.start)
+    series = loadSeries(args.symbol, start=args.start)
     events = pickEvents(
-        df,
+        series,
         xPct=args.percent / 100.0,
         direction=args.direction,
         cooldownDays=args.cooldownDays,
     )
-    outcomes = forwardReturns(df, events, horizons=horizons)
+    benchClose = None
+    if args.benchmark:
+        benchClose = alignBenchmark(loadBenchmark(args.benchmark, start=args.start), series.dates)
+    outcomes = forwardReturns(series, events, horizons=horizons, benchmark=benchClose)
     summary = summarize(outcomes, horizons=horizons)
 
     # header
@@ -48,11 +54,12 @@ def main():
         + " moves ≥ " + str(args.percent) + "%"
         + "  Sample=" + str(len(events))
         + ("  (cooldownDays=" + str(args.cooldownDays) + ")" if args.cooldownDays else "")
+        + ("  Excess vs " + args.benchmark if args.benchmark else "")
     )
     print(summary.to_string(index=False))
 
     # build event table for preview/export
-    eventTable = makeEventTable(df, events)
+    eventTable = makeEventTable(series, events)
 
     # optional: save CSV of all event dates/details
     if args.eventsOut and len(eventTable) > 0:
@@ -4,6 +4,7 @@ from datetime import datetime, timedelta, timezone
 import numpy as np
 import pandas as pd
 import yfinance as yf
+from event_study import loadBenchmark, alignBenchmark
 
 # -------------- Data fetch utils --------------
 
@@ -85,46 +86,56 @@ def nTradingDaysBefore(df, anchorTs, n):
 
 # -------------- Core backtest --------------
 
-def computeRunupsForTicker(ticker, xCount, yValues):
-    earningsDates = getPastEarningsDates(ticker, maxFetch=60, count=xCount)
+def historyPadDays(yValues):
+    # Max Y we’ll need (trading days). Approx pad calendar by ~ (Y * 1.7) to cover weekends/holidays.
+    maxY = max(yValues) if yValues else 20
+    return int(maxY * 2) + 15
+
+def computeRunupsForTicker(ticker, xCount, yValues, benchmark=None, earningsDates=None):
+    # benchmark: a loadBenchmark() series covering this ticker's history; adds excess run-up columns
+    # earningsDates: already-fetched dates (skips the lookup)
+    if earningsDates is None:
+        earningsDates = getPastEarningsDates(ticker, maxFetch=60, count=xCount)
     if not earningsDates:
         return [], []
 
     # Pull enough history to cover the earliest window
     earliest = min(earningsDates)
-    # Max Y we’ll need (trading days). Approx pad calendar by ~ (Y * 1.7) to cover weekends/holidays.
-    maxY = max(yValues) if yValues else 20
-    padDays = int(maxY * 2) + 15
+    padDays = historyPadDays(yValues)
     start = (earliest - timedelta(days=padDays)).isoformat()
     end = (max(earningsDates) + timedelta(days=5)).isoformat()
     prices = loadHistory(ticker, start, end)
     if prices.empty:
         return [], []
+    benchClose = alignBenchmark(benchmark, prices.index) if benchmark is not None else None
 
-    # Pre-compute the pre-earnings close timestamps for each earnings date
+    # Pre-compute the pre-earnings close timestamps (and row positions) for each earnings date
+    prePositions = prices.index.searchsorted(pd.to_datetime(earningsDates)) - 1
     anchors = []
-    for ed in earningsDates:
+    for ed, prePos in zip(earningsDates, prePositions):
         preTs, preClose = lastCloseBefore(prices, ed)
         if preClose is None:
-            anchors.append((ed, None, None))
+            anchors.append((ed, None, None, None))
         else:
-            anchors.append((ed, preTs, preClose))
+            anchors.append((ed, preTs, preClose, int(prePos)))
 
     # Build per-earnings rows for each Y and summary rows per Y
     perRows = []
     summaryRows = []
     for y in yValues:
         runups = []
+        excessRunups = []
+        excessWins = 0
         samples = 0
         wins = 0
-        for ed, preTs, preClose in anchors:
+        for ed, preTs, preClose, prePos in anchors:
             if preClose is None:
                 continue
             baseTs, baseClose = nTradingDaysBefore(prices, preTs, y)
             if baseClose is None:
                 continue
             pct = (preClose - baseClose) / baseClose * 100.0
-            perRows.append({
+            row = {
                 "ticker": ticker,
                 "earningsDate": ed.isoformat(),
                 "yTradingDays": y,
@@ -134,7 +145,18 @@ def computeRunupsForTicker(ticker, xCount, yValues):
                 "preEarningsClose": round(preClose, 4),
                 "runupPct": round(pct, 2),
                 "status": "ok"
-            })
+            }
+            if benchClose is not None:
+                # base anchor is the y-th session before the pre-earnings close
+                benchBase = benchClose[prePos - y]
+                benchPre = benchClose[prePos]
+                excessPct = pct - (benchPre - benchBase) / benchBase * 100.0
+                row["excessRunupPct"] = round(excessPct, 2)
+                if not np.isnan(excessPct):
+                    excessRunups.append(excessPct)
+                    if excessPct > 0:
+                        excessWins += 1
+            perRows.append(row)
             runups.append(pct)
             samples += 1
             if pct > 0:
@@ -144,7 +166,7 @@ def computeRunupsForTicker(ticker, xCount, yValues):
             avg = float(np.mean(runups))
             std = float(np.std(runups, ddof=1)) if samples > 1 else 0.0
             winRate = wins / samples
-            summaryRows.append({
+            summaryRow = {
                 "ticker": ticker,
                 "xCount": xCount,
                 "yTradingDays": y,
@@ -152,25 +174,40 @@ def computeRunupsForTicker(ticker, xCount, yValues):
                 "stdRunupPct": round(std, 3),
                 "winRate": round(winRate, 3),
                 "samples": samples
-            })
+            }
+            if benchClose is not None:
+                n = len(excessRunups)
+                summaryRow["avgExcessRunupPct"] = round(float(np.mean(excessRunups)), 3) if n > 0 else np.nan
+                summaryRow["stdExcessRunupPct"] = round(float(np.std(excessRunups, ddof=1)), 3) if n > 1 else 0.0
+                summaryRow["excessWinRate"] = round(excessWins / n, 3) if n > 0 else np.nan
+                summaryRow["excessSamples"] = n
+            summaryRows.append(summaryRow)
     return perRows, summaryRows
 
-def pickBestYPerTicker(summaryDf, minWin=0.0, minSamples=2, score="sharpe"):
+def pickBestYPerTicker(summaryDf, minWin=0.0, minSamples=2, score="sharpe", excess=False):
     # score options: 'avg', 'sharpe' (avg/std), 'avg_with_win'
+    # excess=True scores on the benchmark-relative run-up columns
+    avgCol = "avgExcessRunupPct" if excess else "avgRunupPct"
+    stdCol = "stdExcessRunupPct" if excess else "stdRunupPct"
+    samplesCol = "excessSamples" if excess else "samples"
+    winCol = "excessWinRate" if excess else "winRate"
     df = summaryDf.copy()
-    df = df[df["samples"] >= minSamples]
-    df = df[df["winRate"] >= minWin]
+    df = df[df[samplesCol] >= minSamples]
+    df = df[df[winCol] >= minWin]
     if df.empty:
         return df
 
     if score == "avg":
-        df["score"] = df["avgRunupPct"]
+        df["score"] = df[avgCol]
     elif score == "avg_with_win":
-        df["score"] = df["avgRunupPct"] * (0.5 + 0.5 * df["winRate"])
+        df["score"] = df[avgCol] * (0.5 + 0.5 * df[winCol])
     else:
         # sharpe-like: penalize volatility; avoid divide-by-zero
-        df["score"] = df["avgRunupPct"] / df["stdRunupPct"].replace(0, np.nan)
-        df["score"] = df["score"].fillna(df["avgRunupPct"])  # if std=0, fall back to avg
+        df["score"] = df[avgCol] / df[stdCol].replace(0, np.nan)
+        df["score"] = df["score"].fillna(df[avgCol])  # if std=0, fall back to avg
+    df = df.dropna(subset=["score"])
+    if df.empty:
+        return df
 
     # pick best row per ticker
     idx = df.groupby("ticker")["score"].idxmax()
@@ -190,6 +227,7 @@ def main():
     ap.add_argument("--out", default="best.csv", help="CSV for best Y per ticker")
     ap.add_argument("--grid", default="all_results.csv", help="CSV for all Y results")
     ap.add_argument("--per", default="per_rows.csv", help="CSV for per-earnings rows")
+    ap.add_argument("--benchmark", default=None, help="Also report/rank excess run-ups vs this ticker, e.g. SPY")
     args = ap.parse_args()
 
     if not args.tickers and not args.tickers_file:
@@ -204,10 +242,24 @@ def main():
 
     yValues = sorted({int(v.strip()) for v in args.ys.split(",") if v.strip()})
 
+    # with a benchmark, fetch earnings dates up front so the benchmark is loaded once,
+    # from the earliest start any ticker needs
+    earningsByTicker = {}
+    benchmark = None
+    if args.benchmark:
+        for t in tickers:
+            earningsByTicker[t] = getPastEarningsDates(t, maxFetch=60, count=args.x)
+        allDates = [d for dates in earningsByTicker.values() for d in dates]
+        if allDates:
+            benchStart = min(allDates) - timedelta(days=historyPadDays(yValues))
+            benchmark = loadBenchmark(args.benchmark, start=benchStart.isoformat())
+
     allPer = []
     allSummary = []
     for t in tickers:
-        perRows, summaryRows = computeRunupsForTicker(t, xCount=args.x, yValues=yValues)
+        perRows, summaryRows = computeRunupsForTicker(
+            t, xCount=args.x, yValues=yValues, benchmark=benchmark, earningsDates=earningsByTicker.get(t)
+        )
         allPer.extend(perRows)
         allSummary.extend(summaryRows)
 
@@ -216,10 +268,14 @@ def main():
 
     if not summaryDf.empty:
         bestDf = pickBestYPerTicker(
-            summaryDf, minWin=args.min_win, minSamples=args.min_samples, score=args.score
+            summaryDf, minWin=args.min_win, minSamples=args.min_samples, score=args.score,
+            excess=bool(args.benchmark),
         )
     else:
-        bestDf = pd.DataFrame(columns=["ticker","xCount","yTradingDays","avgRunupPct","stdRunupPct","winRate","samples","score"])
+        bestCols = ["ticker","xCount","yTradingDays","avgRunupPct","stdRunupPct","winRate","samples"]
+        if args.benchmark:
+            bestCols += ["avgExcessRunupPct","stdExcessRunupPct","excessWinRate","excessSamples"]
+        bestDf = pd.DataFrame(columns=bestCols + ["score"])
 
     summaryDf.to_csv(args.grid, index=False)
     bestDf.to_csv(args.out, index=False)
@@ -12,9 +12,139 @@ def loadDaily(symbol, start="2012-01-01", end=None):
     df["ret1"] = df["Close"].pct_change()
     return df
 
+# -------------- Lean array-backed series --------------
+
+def toEpochDays(index):
+    idx = pd.DatetimeIndex(index)
+    if idx.tz is not None:
+        idx = idx.tz_localize(None)
+    return idx.values.astype("datetime64[D]").astype(np.int64)
+
+def fromEpochDays(days):
+    return pd.DatetimeIndex(np.asarray(days, dtype=np.int64).astype("datetime64[D]"))
+
+def _column(df, col, dtype):
+    # yfinance may hand back a one-column frame per field; flatten it
+    return np.ascontiguousarray(np.asarray(df[col], dtype=dtype).reshape(-1))
+
+class PriceSeries:
+    """
+    Compact daily series for the event-study hot path.
+    dates are int64 epoch days and close is float64; ret1 is derived from close
+    on demand rather than stored. Open (float64) and Volume (int64) are only
+    kept when full=True, for makeEventTable; otherwise they are None.
+    """
+    __slots__ = ("dates", "close", "open", "volume", "_dayPos")
+
+    def __init__(self, dates, close, open=None, volume=None):
+        self.dates = np.ascontiguousarray(dates, dtype=np.int64)
+        self.close = np.ascontiguousarray(close, dtype=np.float64)
+        self.open = None if open is None else np.ascontiguousarray(open, dtype=np.float64)
+        self.volume = None if volume is None else np.ascontiguousarray(volume, dtype=np.int64)
+        self._dayPos = None
+
+    @classmethod
+    def fromFrame(cls, df, full=True):
+        if not full:
+            return cls(toEpochDays(df.index), _column(df, "Close", np.float64))
+        return cls(
+            toEpochDays(df.index),
+            _column(df, "Close", np.float64),
+            open=_column(df, "Open", np.float64),
+            volume=_column(df, "Volume", np.int64),
+        )
+
+    def __len__(self):
+        return len(self.dates)
+
+    @property
+    def ret1(self):
+        # close/close % change, same as loadDaily's pct_change (NaN on the first row)
+        return self.ret1At(np.arange(len(self.close)))
+
+    def ret1At(self, pos):
+        pos = np.asarray(pos, dtype=np.int64)
+        out = np.full(len(pos), np.nan)
+        ok = pos > 0
+        out[ok] = self.close[pos[ok]] / self.close[pos[ok] - 1] - 1.0
+        return out
+
+    def buildDayMap(self):
+        # dense epoch-day -> row map over the calendar span; only worth it for
+        # series that get aligned against many others (benchmarks)
+        if self._dayPos is None and len(self.dates) > 0:
+            dayPos = np.full(int(self.dates[-1] - self.dates[0]) + 1, -1, dtype=np.int32)
+            dayPos[self.dates - self.dates[0]] = np.arange(len(self.dates), dtype=np.int32)
+            self._dayPos = dayPos
+        return self
+
+    def positionsOf(self, days):
+        # row position of each epoch day; -1 means no session that day
+        days = np.asarray(days, dtype=np.int64)
+        if self._dayPos is not None:
+            offs = days - self.dates[0]
+            inRange = (offs >= 0) & (offs < len(self._dayPos))
+            pos = np.full(len(days), -1, dtype=np.int64)
+            pos[inRange] = self._dayPos[offs[inRange]]
+            return pos
+        pos = np.searchsorted(self.dates, days).astype(np.int64)
+        hit = pos < len(self.dates)
+        hit[hit] = self.dates[pos[hit]] == days[hit]
+        pos[~hit] = -1
+        return pos
+
+    def toFrame(self):
+        data = {"Close": self.close, "ret1": self.ret1}
+        if self.open is not None:
+            data = {"Open": self.open, "Close": self.close, "Volume": self.volume, "ret1": self.ret1}
+        return pd.DataFrame(data, index=fromEpochDays(self.dates))
+
+def asSeries(data):
+    if isinstance(data, PriceSeries):
+        return data
+    return PriceSeries.fromFrame(data, full=all(c in data.columns for c in ("Open", "Volume")))
+
+def loadSeries(symbol, start="2012-01-01", end=None, full=True):
+    return PriceSeries.fromFrame(loadDaily(symbol, start=start, end=end), full=full)
+
+# one load per benchmark symbol per process; reloaded only if an earlier start is asked for
+_benchmarkCache = {}
+
+def loadBenchmark(symbol, start="2012-01-01"):
+    symbol = symbol.strip().upper()
+    start = pd.Timestamp(start)
+    cached = _benchmarkCache.get(symbol)
+    if cached is None or start < cached[0]:
+        cached = (start, loadSeries(symbol, start=start.strftime("%Y-%m-%d"), full=False).buildDayMap())
+        _benchmarkCache[symbol] = cached
+    return cached[1]
+
+def alignBenchmark(benchmark, dates):
+    """
+    Benchmark closes on the given sessions (int64 epoch days or a DatetimeIndex),
+    NaN where the benchmark has no session that day.
+    """
+    if not (isinstance(dates, np.ndarray) and dates.dtype == np.int64):
+        dates = toEpochDays(dates)
+    pos = benchmark.positionsOf(dates)
+    out = np.full(len(pos), np.nan)
+    ok = pos >= 0
+    out[ok] = benchmark.close[pos[ok]]
+    return out
+
+def _eventPositions(series, eventIndex):
+    # sorted, de-duplicated row positions of the events present in the series
+    pos = series.positionsOf(toEpochDays(eventIndex))
+    return np.unique(pos[pos >= 0])
+
+# -------------- Study --------------
+
 def pickEvents(df, xPct, direction="both", cooldownDays=0):
-    upMask = df["ret1"] >= xPct
-    downMask = df["ret1"] <= -xPct
+    series = asSeries(df)
+    ret1 = series.ret1
+    with np.errstate(invalid="ignore"):
+        upMask = ret1 >= xPct
+        downMask = ret1 <= -xPct
     if direction == "up":
         mask = upMask
     elif direction == "down":
@@ -22,49 +152,65 @@ def pickEvents(df, xPct, direction="both", cooldownDays=0):
     else:
         mask = upMask | downMask
 
-    idx = df.index[mask]
-    if cooldownDays <= 0:
-        return idx
-
-    kept = []
-    last = None
-    for t in idx:
-        if last is None or (t - last).days > cooldownDays:
-            kept.append(t)
-            last = t
-    return pd.DatetimeIndex(kept)
-
-def forwardReturns(df, eventIndex, horizons=(1, 3, 5, 10, 20)):
-    close = df["Close"]
-    posByTs = {}
-    for ts in eventIndex:
-        if ts in close.index:
-            posByTs[ts] = close.index.get_loc(ts)
-
-    rows = []
-    for ts, i in posByTs.items():
-        row = {"t": ts}
-        for h in horizons:
-            j = i + h
-            if j >= len(close):
-                row["R+" + str(h)] = np.nan
-            else:
-                row["R+" + str(h)] = (close.iloc[j] / close.iloc[i] - 1.0).item()
-        rows.append(row)
-
-    if len(rows) == 0:
-        return pd.DataFrame(columns=["t"] + ["R+" + str(h) for h in horizons]).set_index("t")
-    return pd.DataFrame(rows).set_index("t").sort_index()
+    pos = np.flatnonzero(mask)
+    if cooldownDays > 0:
+        kept = []
+        last = None
+        for i, d in zip(pos.tolist(), series.dates[pos].tolist()):
+            if last is None or d - last > cooldownDays:
+                kept.append(i)
+                last = d
+        pos = np.asarray(kept, dtype=np.int64)
+
+    # DataFrame input gets a slice of its own index back (keeps tz, usable with df.loc)
+    if isinstance(df, PriceSeries):
+        return fromEpochDays(series.dates[pos])
+    return df.index[pos]
+
+def forwardReturns(df, eventIndex, horizons=(1, 3, 5, 10, 20), asFrame=True, benchmark=None):
+    """
+    Forward close/close returns for each event.
+    asFrame=False skips the DataFrame and returns {"t": epoch days, "R+h": array, ...},
+    which summarize accepts directly.
+    benchmark: closes aligned to the series (see alignBenchmark); returns become excess returns.
+    """
+    series = asSeries(df)
+    close = series.close
+    if benchmark is not None and len(benchmark) != len(close):
+        raise ValueError(
+            "benchmark has " + str(len(benchmark)) + " rows but the series has "
+            + str(len(close)) + "; align it with alignBenchmark first"
+        )
+    pos = _eventPositions(series, eventIndex)
+
+    out = {"t": series.dates[pos]}
+    for h in horizons:
+        vals = np.full(len(pos), np.nan)
+        j = pos + h
+        ok = j < len(close)
+        vals[ok] = close[j[ok]] / close[pos[ok]] - 1.0
+        if benchmark is not None:
+            vals[ok] -= benchmark[j[ok]] / benchmark[pos[ok]] - 1.0
+        out["R+" + str(h)] = vals
+
+    if not asFrame:
+        return out
+    # DataFrame input keeps its own index (tz included), as in pickEvents
+    out.pop("t")
+    t = fromEpochDays(series.dates[pos]) if isinstance(df, PriceSeries) else df.index[pos]
+    t = t.rename("t")
+    return pd.DataFrame(out, index=t, columns=["R+" + str(h) for h in horizons])
 
 def summarize(outcomes, horizons=(1, 3, 5, 10, 20)):
     summary = []
     for h in horizons:
         col = "R+" + str(h)
-        s = outcomes[col].dropna() if col in outcomes.columns else pd.Series([], dtype=float)
+        s = np.asarray(outcomes[col], dtype=np.float64) if col in outcomes else np.empty(0)
+        s = s[~np.isnan(s)]
         n = int(s.shape[0])
 
         meanVal = float(s.mean()) if n > 0 else np.nan
-        medianVal = float(s.median()) if n > 0 else np.nan
+        medianVal = float(np.median(s)) if n > 0 else np.nan
         stdVal = float(s.std(ddof=1)) if n > 1 else np.nan
         winRate = float((s > 0).mean()) if n > 0 else np.nan
 
@@ -96,16 +242,18 @@ def makeEventTable(df, eventIndex):
     """
     Build a compact table of event dates and details.
     Columns: Date, EventMovePct (close/close), Open, Close, Volume
+    Open/Volume are NaN when the series was built without full OHLCV.
     """
-    rows = []
-    for ts in eventIndex:
-        rows.append({
-            "Date": ts.strftime("%Y-%m-%d"),
-            "EventMovePct": float(df.loc[ts, "ret1"]),  # already close/close % change
-            "Open": float(df.loc[ts, "Open"]),
-            "Close": float(df.loc[ts, "Close"]),
-            "Volume": int(df.loc[ts, "Volume"])
-        })
-    if not rows:
+    series = asSeries(df)
+    pos = _eventPositions(series, eventIndex)
+    if len(pos) == 0:
         return pd.DataFrame(columns=["Date", "EventMovePct", "Open", "Close", "Volume"])
-    return pd.DataFrame(rows).sort_values("Date").reset_index(drop=True)
+
+    nanCol = np.full(len(pos), np.nan)
+    return pd.DataFrame({
+        "Date": np.datetime_as_string(series.dates[pos].astype("datetime64[D]")),
+        "EventMovePct": series.ret1At(pos),  # already close/close % change
+        "Open": nanCol if series.open is None else series.open[pos],
+        "Close": series.close[pos],
+        "Volume": nanCol if series.volume is None else series.volume[pos],
+    })
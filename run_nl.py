@@ -3,14 +3,16 @@ import sys
 import argparse
 from nlp import parseQuery
 from event_study import (
-    loadDaily,
+    loadSeries,
     pickEvents,
     forwardReturns,
     summarize,
     makeEventTable,   # make sure this exists in event_study.py
+    loadBenchmark,
+    alignBenchmark,
 )
 
-def answer(query, currentSymbol=None, start="2012-01-01", cooldownDays=3, showDates=0, eventsOut=None):
+def answer(query, currentSymbol=None, start="2012-01-01", cooldownDays=3, showDates=0, eventsOut=None, benchmark=None):
     params = parseQuery(query, currentSymbol=currentSymbol)
 
     symbol = params.get("symbol")
@@ -26,18 +28,24 @@ def answer(query, currentSymbol=None, start="2012-01-01", cooldownDays=3, showDa
             "events": None,
             "preview": None,
             "eventsOut": eventsOut,
+            "benchmark": benchmark,
         }
 
-    df = loadDaily(symbol, start=start)
+    series = loadSeries(symbol, start=start)
     events = pickEvents(
-        df,
+        series,
         xPct=percentVal / 100.0,
         direction=params.get("direction", "both"),
         cooldownDays=cooldownDays,
     )
-    outcomes = forwardReturns(df, events, horizons=params.get("horizons", (1,3,5,10,20)))
+    benchClose = None
+    if benchmark:
+        benchClose = alignBenchmark(loadBenchmark(benchmark, start=start), series.dates)
+    outcomes = forwardReturns(
+        series, events, horizons=params.get("horizons", (1,3,5,10,20)), benchmark=benchClose
+    )
     summary = summarize(outcomes, horizons=params.get("horizons", (1,3,5,10,20)))
-    eventTable = makeEventTable(df, events)
+    eventTable = makeEventTable(series, events)
 
     # CSV export
     if eventsOut and len(eventTable) > 0:
@@ -58,6 +66,7 @@ def answer(query, currentSymbol=None, start="2012-01-01", cooldownDays=3, showDa
         "events": eventTable,
         "preview": preview,
         "eventsOut": eventsOut,
+        "benchmark": benchmark,
     }
 
 def main():
@@ -68,6 +77,7 @@ def main():
     ap.add_argument("--cooldownDays", type=int, default=3)
     ap.add_argument("--showDates", type=int, default=0, help="Print first/last K event dates")
     ap.add_argument("--eventsOut", default=None, help="CSV path to save all event dates")
+    ap.add_argument("--benchmark", default=None, help="Report excess returns vs this ticker, e.g. SPY")
     args = ap.parse_args()
 
     # Default demo query if none provided
@@ -80,6 +90,7 @@ def main():
         cooldownDays=args.cooldownDays,
         showDates=args.showDates,
         eventsOut=args.eventsOut,
+        benchmark=args.benchmark,
     )
 
     # Always show how we parsed the query
@@ -90,6 +101,8 @@ def main():
         return
 
     print("Sample:", res["sample"], flush=True)
+    if res["benchmark"]:
+        print("Excess returns vs", res["benchmark"], flush=True)
     print(res["summary"].to_string(index=False), flush=True)
 
     if res["preview"] is not None: